@@ -9,68 +9,100 @@ Provides a visual interface with VM status display and control buttons.
 import os
 import sys
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTextEdit, QGroupBox, QDialog, QFormLayout,
-    QLineEdit, QFileDialog, QMessageBox, QProgressBar, QFrame
+    QLabel, QPushButton, QPlainTextEdit, QGroupBox, QDialog, QFormLayout,
+    QLineEdit, QFileDialog, QMessageBox, QFrame
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QThread
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QEvent
 from PySide6.QtGui import QFont, QIcon, QPalette
 
-from .main import GCPVMManager, load_saved_config, save_config, validate_config, clear_saved_config, get_config_file_path
+from .main import (
+    GCPVMManager, load_saved_config, save_config, validate_config, clear_saved_config,
+    get_config_file_path, release_client, apply_env_overrides
+)
 
 
 class VMWorker(QObject):
-    """Worker thread for VM operations to prevent GUI freezing."""
+    """Runs VM operations on the GUI's thread pool to prevent GUI freezing.
+
+    The worker itself lives on the GUI thread; its methods are submitted to a
+    ThreadPoolExecutor, so emitted signals are queued back to the GUI thread.
+    """
     
     status_updated = Signal(str)
     operation_completed = Signal(bool, str)  # success, message
     error_occurred = Signal(str)
     
+    # Seconds to wait after a start/stop before reading the new status
+    POST_OPERATION_DELAY = 2.0
+    
     def __init__(self, vm_manager: GCPVMManager):
         super().__init__()
         self.vm_manager = vm_manager
+        self._cancelled = threading.Event()
+    
+    def cancel(self):
+        """Discard the results of any operation still running on this worker."""
+        self._cancelled.set()
+    
+    def _emit(self, signal, *args):
+        """Emit a signal unless the worker has been cancelled."""
+        if not self._cancelled.is_set():
+            signal.emit(*args)
         
-    def get_status(self):
-        """Get VM status in background thread."""
+    def get_status(self, force: bool = False):
+        """Get VM status in background thread, reusing a recent result unless forced."""
         try:
-            status = self.vm_manager.get_instance_status()
+            status = self.vm_manager.get_instance_status(force=force)
             if status:
-                self.status_updated.emit(status)
+                self._emit(self.status_updated, status)
             else:
-                self.error_occurred.emit("Failed to get VM status")
+                self._emit(self.error_occurred, "Failed to get VM status")
         except Exception as e:
-            self.error_occurred.emit(f"Error getting status: {str(e)}")
+            self._emit(self.error_occurred, f"Error getting status: {str(e)}")
     
-    def start_vm(self):
-        """Start VM in background thread."""
+    def _refresh_after_operation(self):
+        """Read the new status in the same task, once the VM has had a moment to change."""
+        if not self._cancelled.wait(self.POST_OPERATION_DELAY):
+            self.get_status(force=True)
+    
+    def _run(self, operation, action: str, success_message: str, failure_message: str):
+        """Run a start/stop operation and report its outcome."""
         try:
-            success = self.vm_manager.start_instance()
-            if success:
-                self.operation_completed.emit(True, "VM start operation initiated successfully")
-            else:
-                self.operation_completed.emit(False, "Failed to start VM")
+            success = operation()
         except Exception as e:
-            self.error_occurred.emit(f"Error starting VM: {str(e)}")
+            self._emit(self.error_occurred, f"Error {action}: {str(e)}")
+            return
+        
+        if success:
+            self._emit(self.operation_completed, True, success_message)
+            self._refresh_after_operation()
+        else:
+            self._emit(self.operation_completed, False, failure_message)
+    
+    def start_vm(self):
+        """Start VM in background thread."""
+        # Don't hold a pool thread for the whole operation; progress is polled instead
+        self._run(lambda: self.vm_manager.start_instance(wait=False), "starting VM",
+                  "VM start operation initiated successfully", "Failed to start VM")
     
     def stop_vm(self):
         """Stop VM in background thread."""
-        try:
-            success = self.vm_manager.stop_instance()
-            if success:
-                self.operation_completed.emit(True, "VM stop operation initiated successfully")
-            else:
-                self.operation_completed.emit(False, "Failed to stop VM")
-        except Exception as e:
-            self.error_occurred.emit(f"Error stopping VM: {str(e)}")
+        self._run(lambda: self.vm_manager.stop_instance(wait=False), "stopping VM",
+                  "VM stop operation initiated successfully", "Failed to stop VM")
 
 
 class ConfigDialog(QDialog):
     """Configuration dialog for VM settings."""
     
+    INVALID_STYLE = "border: 1px solid red;"
+    
     def __init__(self, parent=None, config=None):
         super().__init__(parent)
         self.setWindowTitle("GCP VM Configuration")
@@ -121,17 +153,36 @@ class ConfigDialog(QDialog):
         # Buttons
         button_layout = QHBoxLayout()
         
-        save_btn = QPushButton("Save")
-        save_btn.clicked.connect(self.save_and_accept)
-        save_btn.setDefault(True)
+        self.save_btn = QPushButton("Save")
+        self.save_btn.clicked.connect(self.save_and_accept)
+        self.save_btn.setDefault(True)
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         
-        button_layout.addWidget(save_btn)
+        button_layout.addWidget(self.save_btn)
         button_layout.addWidget(cancel_btn)
         
         layout.addLayout(button_layout)
+        
+        # Validate as the user types instead of after Save
+        self.required_edits = (
+            self.project_id_edit,
+            self.zone_edit,
+            self.instance_name_edit,
+            self.service_key_edit,
+        )
+        for edit in self.required_edits:
+            edit.textChanged.connect(self._revalidate)
+    
+    def _revalidate(self):
+        """Highlight empty required fields and only enable Save when all are set."""
+        valid = True
+        for edit in self.required_edits:
+            filled = bool(edit.text().strip())
+            edit.setStyleSheet("" if filled else self.INVALID_STYLE)
+            valid = valid and filled
+        self.save_btn.setEnabled(valid)
     
     def browse_service_key(self):
         """Open file dialog to browse for service key file."""
@@ -150,18 +201,15 @@ class ConfigDialog(QDialog):
         self.zone_edit.setText(self.config.get('zone', ''))
         self.instance_name_edit.setText(self.config.get('instance_name', ''))
         self.service_key_edit.setText(self.config.get('service_key_path', ''))
+        self._revalidate()
     
     def save_and_accept(self):
         """Save configuration and accept dialog."""
-        config = self.get_config()
-        if validate_config(config):
-            if save_config(config):
-                self.accept()
-            else:
-                QMessageBox.warning(self, "Save Error", "Failed to save configuration.")
+        # Fields are validated as they change; Save is only enabled when complete
+        if save_config(self.get_config()):
+            self.accept()
         else:
-            QMessageBox.warning(self, "Invalid Configuration", 
-                              "Please fill in all required fields.")
+            QMessageBox.warning(self, "Save Error", "Failed to save configuration.")
     
     def get_config(self):
         """Get the configuration from the dialog."""
@@ -176,6 +224,21 @@ class ConfigDialog(QDialog):
 class GCPVMManagerGUI(QMainWindow):
     """Main GUI window for GCP VM Manager."""
     
+    # Auto-refresh intervals (ms): normal, and while the VM is changing state
+    AUTO_REFRESH_INTERVAL = 30000
+    TRANSITION_REFRESH_INTERVAL = 5000
+    TRANSITIONAL_STATES = frozenset({"PROVISIONING", "STAGING", "STOPPING", "SUSPENDING", "REPAIRING"})
+    
+    STATUS_STYLE_BASE = "font-weight: bold; font-size: 14px;"
+    STATUS_STYLE_RUNNING = "color: green; " + STATUS_STYLE_BASE
+    STATUS_STYLE_TERMINATED = "color: red; " + STATUS_STYLE_BASE
+    STATUS_STYLE_OTHER = "color: orange; " + STATUS_STYLE_BASE
+    STATUS_STYLE_ERROR = "color: red; " + STATUS_STYLE_BASE
+    
+    WORKER_CONNECTION = Qt.ConnectionType(Qt.QueuedConnection.value | Qt.UniqueConnection.value)
+    
+    SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("GCP VM Manager")
@@ -185,7 +248,12 @@ class GCPVMManagerGUI(QMainWindow):
         self.vm_manager = None
         self.config = {}
         self.worker = None
-        self.worker_thread = None
+        self._pending = set()
+        self._inflight = set()
+        self._current_style = None
+        
+        # Persistent pool for VM operations; outlives config resets
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="vm-op")
         
         # Setup UI
         self.setup_ui()
@@ -193,9 +261,14 @@ class GCPVMManagerGUI(QMainWindow):
         # Setup timer for auto-refresh
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_status)
+        self._auto_refresh_paused = False
         
-        # Load initial config
-        self.load_initial_config()
+        # Log lines are buffered and flushed together to avoid a re-layout per line
+        self._log_buf = deque()
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
     
     def setup_ui(self):
         """Setup the main window UI."""
@@ -224,6 +297,8 @@ class GCPVMManagerGUI(QMainWindow):
         
         self.config_label = QLabel("No configuration loaded")
         self.config_label.setWordWrap(True)
+        # Add config file location in tooltip
+        self.config_label.setToolTip(f"Configuration file: {get_config_file_path()}")
         config_layout.addWidget(self.config_label)
         
         config_btn_layout = QHBoxLayout()
@@ -239,6 +314,24 @@ class GCPVMManagerGUI(QMainWindow):
         config_btn_layout.addStretch()
         config_layout.addLayout(config_btn_layout)
         
+        # Inline reset confirmation (avoids a modal dialog's nested event loop)
+        self.reset_banner = QFrame()
+        self.reset_banner.setFrameShape(QFrame.StyledPanel)
+        reset_banner_layout = QHBoxLayout(self.reset_banner)
+        reset_banner_layout.addWidget(QLabel("Clear saved configuration?"))
+        reset_banner_layout.addStretch()
+        
+        confirm_reset_btn = QPushButton("Confirm")
+        confirm_reset_btn.clicked.connect(self._do_reset)
+        reset_banner_layout.addWidget(confirm_reset_btn)
+        
+        cancel_reset_btn = QPushButton("Cancel")
+        cancel_reset_btn.clicked.connect(self._cancel_reset)
+        reset_banner_layout.addWidget(cancel_reset_btn)
+        
+        self.reset_banner.setVisible(False)
+        config_layout.addWidget(self.reset_banner)
+        
         layout.addWidget(config_group)
         
         # VM Status group
@@ -250,21 +343,25 @@ class GCPVMManagerGUI(QMainWindow):
         status_display_layout.addWidget(QLabel("Current Status:"))
         
         self.status_label = QLabel("Unknown")
-        self.status_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self._set_status_style(self.STATUS_STYLE_BASE)
         status_display_layout.addWidget(self.status_label)
+        
+        # Activity spinner, animated only while an operation is in flight
+        self.spinner_label = QLabel("")
+        self._spinner_frame = 0
+        self._spinner_timer = QTimer(self)
+        self._spinner_timer.setInterval(250)
+        self._spinner_timer.timeout.connect(self._advance_spinner)
+        status_display_layout.addWidget(self.spinner_label)
         status_display_layout.addStretch()
         
         self.refresh_btn = QPushButton("🔄 Refresh")
-        self.refresh_btn.clicked.connect(self.refresh_status)
+        self.refresh_btn.clicked.connect(self.on_refresh_clicked)
+        self.refresh_btn.setToolTip("Shift-click to bypass the cached status")
         status_display_layout.addWidget(self.refresh_btn)
         
         status_layout.addLayout(status_display_layout)
         
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        status_layout.addWidget(self.progress_bar)
-        
         layout.addWidget(status_group)
         
         # Control buttons group
@@ -307,9 +404,11 @@ class GCPVMManagerGUI(QMainWindow):
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
+        # Bound memory during long sessions; Qt drops the oldest lines
+        self.log_text.setMaximumBlockCount(2000)
         log_layout.addWidget(self.log_text)
         
         layout.addWidget(log_group)
@@ -324,15 +423,7 @@ class GCPVMManagerGUI(QMainWindow):
             self.config = load_saved_config()
             
             # Override with environment variables if set
-            import os
-            if os.getenv('GCP_PROJECT_ID'):
-                self.config['project_id'] = os.getenv('GCP_PROJECT_ID')
-            if os.getenv('GCP_ZONE'):
-                self.config['zone'] = os.getenv('GCP_ZONE')
-            if os.getenv('GCP_INSTANCE_NAME'):
-                self.config['instance_name'] = os.getenv('GCP_INSTANCE_NAME')
-            if os.getenv('GCP_SERVICE_KEY_PATH'):
-                self.config['service_key_path'] = os.getenv('GCP_SERVICE_KEY_PATH')
+            apply_env_overrides(self.config)
             
             if validate_config(self.config):
                 self.update_config_display()
@@ -361,33 +452,31 @@ class GCPVMManagerGUI(QMainWindow):
                 self.log_message("⚠️ Configuration saved but incomplete. Please fill in all required fields.")
     
     def reset_config(self):
+        """Ask for confirmation before resetting the configuration."""
+        self.reset_banner.setVisible(not self.reset_banner.isVisible())
+    
+    def _cancel_reset(self):
+        """Dismiss the reset confirmation."""
+        self.reset_banner.setVisible(False)
+    
+    def _do_reset(self):
         """Reset the configuration."""
-        reply = QMessageBox.question(
-            self, 
-            "Reset Configuration", 
-            "Are you sure you want to clear the saved configuration?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            if clear_saved_config():
-                self.config = {}
-                self.vm_manager = None
-                self.worker = None
-                if self.worker_thread:
-                    self.worker_thread.quit()
-                    self.worker_thread.wait()
-                    self.worker_thread = None
-                
-                self.update_config_display()
-                self.status_label.setText("Unknown")
-                self.status_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-                self.start_btn.setEnabled(False)
-                self.stop_btn.setEnabled(False)
-                self.log_message("✅ Configuration reset successfully")
-            else:
-                self.log_message("❌ Failed to reset configuration")
+        self.reset_banner.setVisible(False)
+        if clear_saved_config():
+            self.release_worker()
+            if self.vm_manager:
+                release_client(self.vm_manager.service_key_path)
+            self.config = {}
+            self.vm_manager = None
+            
+            self.update_config_display()
+            self.status_label.setText("Unknown")
+            self._set_status_style(self.STATUS_STYLE_BASE)
+            self.start_btn.setEnabled(False)
+            self.stop_btn.setEnabled(False)
+            self.log_message("✅ Configuration reset successfully")
+        else:
+            self.log_message("❌ Failed to reset configuration")
     
     def update_config_display(self):
         """Update the configuration display."""
@@ -412,20 +501,16 @@ class GCPVMManagerGUI(QMainWindow):
             )
         
         self.config_label.setText(config_text)
-        
-        # Add config file location in tooltip
-        config_file = get_config_file_path()
-        self.config_label.setToolTip(f"Configuration file: {config_file}")
     
     def initialize_vm_manager(self):
         """Initialize the VM manager with current configuration."""
         try:
             # Clear any existing worker to prevent conflicts
-            if self.worker_thread:
-                self.worker_thread.quit()
-                self.worker_thread.wait()
-                self.worker_thread = None
-                self.worker = None
+            self.release_worker()
+            
+            # The compute client is shared; only drop it if the key file changed
+            if self.vm_manager and self.vm_manager.service_key_path != self.config['service_key_path']:
+                release_client(self.vm_manager.service_key_path)
             
             self.vm_manager = GCPVMManager(
                 project_id=self.config['project_id'],
@@ -458,24 +543,51 @@ class GCPVMManagerGUI(QMainWindow):
                                "Please check your configuration and try again.")
     
     def setup_worker(self):
-        """Setup the worker thread for VM operations."""
-        if self.worker_thread:
-            self.worker_thread.quit()
-            self.worker_thread.wait()
-        
-        self.worker_thread = QThread()
+        """Setup the worker for VM operations."""
+        self.release_worker()
         self.worker = VMWorker(self.vm_manager)
-        self.worker.moveToThread(self.worker_thread)
         
-        # Connect signals
-        self.worker.status_updated.connect(self.update_status)
-        self.worker.operation_completed.connect(self.operation_completed)
-        self.worker.error_occurred.connect(self.handle_error)
+        # Worker methods run on pool threads; always deliver results on the GUI thread
+        self.worker.status_updated.connect(self.update_status, self.WORKER_CONNECTION)
+        self.worker.operation_completed.connect(self.operation_completed, self.WORKER_CONNECTION)
+        self.worker.error_occurred.connect(self.handle_error, self.WORKER_CONNECTION)
+    
+    def release_worker(self):
+        """Cancel the current worker and disconnect it from the window."""
+        if not self.worker:
+            return
         
-        self.worker_thread.start()
+        self.worker.cancel()
+        # A running operation keeps the old worker alive; make sure it cannot reach our slots
+        for signal, slot in (
+            (self.worker.status_updated, self.update_status),
+            (self.worker.operation_completed, self.operation_completed),
+            (self.worker.error_occurred, self.handle_error),
+        ):
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
+        self.worker = None
+    
+    def submit_operation(self, fn, *args):
+        """Run a worker method on the thread pool."""
+        future = self._executor.submit(fn, *args)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+    
+    def on_refresh_clicked(self):
+        """Refresh on button click; shift-click forces a fresh API call."""
+        force = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        self.refresh_status(force=force)
     
-    def refresh_status(self):
+    def refresh_status(self, force: bool = False):
         """Refresh the VM status."""
+        # Skip while another operation is outstanding; its result will update the status
+        if self._inflight:
+            return
+        
         if not self.worker or not self.vm_manager:
             self.log_message("⚠️ VM manager not initialized. Please configure the application first.")
             return
@@ -483,8 +595,7 @@ class GCPVMManagerGUI(QMainWindow):
         self.show_progress("Checking VM status...")
         self.refresh_btn.setEnabled(False)
         
-        # Use QTimer.singleShot to call worker method in the worker thread
-        QTimer.singleShot(0, self.worker.get_status)
+        self.submit_operation(self.worker.get_status, force)
     
     def update_status(self, status: str):
         """Update the VM status display."""
@@ -494,20 +605,35 @@ class GCPVMManagerGUI(QMainWindow):
         
         # Update button states based on status
         if status == "RUNNING":
-            self.status_label.setStyleSheet("color: green; font-weight: bold; font-size: 14px;")
+            self._set_status_style(self.STATUS_STYLE_RUNNING)
             self.start_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
         elif status == "TERMINATED":
-            self.status_label.setStyleSheet("color: red; font-weight: bold; font-size: 14px;")
+            self._set_status_style(self.STATUS_STYLE_TERMINATED)
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
         else:
-            self.status_label.setStyleSheet("color: orange; font-weight: bold; font-size: 14px;")
+            self._set_status_style(self.STATUS_STYLE_OTHER)
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(True)
         
+        # Poll faster while the VM is changing state
+        if self.refresh_timer.isActive():
+            if status in self.TRANSITIONAL_STATES:
+                interval = self.TRANSITION_REFRESH_INTERVAL
+            else:
+                interval = self.AUTO_REFRESH_INTERVAL
+            if self.refresh_timer.interval() != interval:
+                self.refresh_timer.setInterval(interval)
+        
         self.log_message(f"📊 VM Status: {status}")
     
+    def _set_status_style(self, style: str):
+        """Apply a status label style, skipping the CSS re-parse if it is unchanged."""
+        if style != self._current_style:
+            self.status_label.setStyleSheet(style)
+            self._current_style = style
+    
     def start_vm(self):
         """Start the VM."""
         if not self.worker:
@@ -518,7 +644,7 @@ class GCPVMManagerGUI(QMainWindow):
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
         
-        QTimer.singleShot(0, self.worker.start_vm)
+        self.submit_operation(self.worker.start_vm)
     
     def stop_vm(self):
         """Stop the VM."""
@@ -530,18 +656,15 @@ class GCPVMManagerGUI(QMainWindow):
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
         
-        QTimer.singleShot(0, self.worker.stop_vm)
+        self.submit_operation(self.worker.stop_vm)
     
     def operation_completed(self, success: bool, message: str):
         """Handle completed VM operations."""
-        self.hide_progress()
-        
         if success:
+            # The worker follows up with the new status; keep progress shown until it arrives
             self.log_message(f"✅ {message}")
-            # Refresh status after a short delay to see the change, but only if VM manager is working
-            if self.vm_manager and self.worker:
-                QTimer.singleShot(2000, self.refresh_status)
         else:
+            self.hide_progress()
             self.log_message(f"❌ {message}")
             # Re-enable buttons without retrying
             self.start_btn.setEnabled(True)
@@ -564,7 +687,7 @@ class GCPVMManagerGUI(QMainWindow):
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("Error")
-        self.status_label.setStyleSheet("color: red; font-weight: bold; font-size: 14px;")
+        self._set_status_style(self.STATUS_STYLE_ERROR)
     
     def toggle_auto_refresh(self):
         """Toggle auto-refresh timer."""
@@ -573,22 +696,32 @@ class GCPVMManagerGUI(QMainWindow):
             self.auto_refresh_btn.setText("▶️ Start Auto-Refresh (30s)")
             self.log_message("⏸️ Auto-refresh stopped")
         else:
-            self.refresh_timer.start(30000)  # 30 seconds
+            self.refresh_timer.start(self.AUTO_REFRESH_INTERVAL)
             self.auto_refresh_btn.setText("⏸️ Stop Auto-Refresh")
             self.log_message("▶️ Auto-refresh started (30 second interval)")
     
     def show_progress(self, message: str):
-        """Show progress bar with message."""
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        """Show progress spinner with message."""
+        self._inflight.add(message)
+        if not self._spinner_timer.isActive():
+            self._spinner_frame = 0
+            self.spinner_label.setText(self.SPINNER_FRAMES[0])
+            self._spinner_timer.start()
         self.cancel_btn.setEnabled(True)
         self.log_message(f"⏳ {message}")
     
     def hide_progress(self):
-        """Hide progress bar."""
-        self.progress_bar.setVisible(False)
+        """Hide progress spinner."""
+        self._inflight.clear()
+        self._spinner_timer.stop()
+        self.spinner_label.setText("")
         self.cancel_btn.setEnabled(False)
     
+    def _advance_spinner(self):
+        """Show the next spinner frame."""
+        self._spinner_frame = (self._spinner_frame + 1) % len(self.SPINNER_FRAMES)
+        self.spinner_label.setText(self.SPINNER_FRAMES[self._spinner_frame])
+    
     def cancel_operations(self):
         """Cancel current operations and reset the interface."""
         self.log_message("🛑 Cancelling operations...")
@@ -598,12 +731,11 @@ class GCPVMManagerGUI(QMainWindow):
             self.refresh_timer.stop()
             self.auto_refresh_btn.setText("▶️ Start Auto-Refresh (30s)")
         
-        # Clean up worker thread
-        if self.worker_thread:
-            self.worker_thread.quit()
-            self.worker_thread.wait()
-            self.worker_thread = None
-            self.worker = None
+        # Drop queued operations and ignore results of running ones
+        for future in list(self._pending):
+            future.cancel()
+        if self.worker:
+            self.setup_worker()
         
         # Reset UI state
         self.hide_progress()
@@ -611,27 +743,51 @@ class GCPVMManagerGUI(QMainWindow):
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("Cancelled")
-        self.status_label.setStyleSheet("color: orange; font-weight: bold; font-size: 14px;")
+        self._set_status_style(self.STATUS_STYLE_OTHER)
         
         self.log_message("✅ Operations cancelled - click Refresh to try again")
     
     def log_message(self, message: str):
         """Add a message to the log."""
-        self.log_text.append(message)
+        self._log_buf.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log(self):
+        """Write buffered log messages in a single append."""
+        if not self._log_buf:
+            return
+        self.log_text.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
         # Auto-scroll to bottom
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def changeEvent(self, event):
+        """Pause auto-refresh while the window is minimized."""
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                if self.refresh_timer.isActive():
+                    self.refresh_timer.stop()
+                    self._auto_refresh_paused = True
+                    self.log_message("⏸️ Auto-refresh paused while minimized")
+            elif self._auto_refresh_paused:
+                # Catch up immediately, then resume the normal interval
+                self._auto_refresh_paused = False
+                self.refresh_timer.start(self.AUTO_REFRESH_INTERVAL)
+                self.refresh_status()
+        super().changeEvent(event)
+    
     def closeEvent(self, event):
         """Handle application close event."""
         # Stop timer
         if self.refresh_timer.isActive():
             self.refresh_timer.stop()
         
-        # Clean up worker thread
-        if self.worker_thread:
-            self.worker_thread.quit()
-            self.worker_thread.wait()
+        # Drop queued operations without blocking on in-flight ones; those are
+        # bounded by GCPVMManager.REQUEST_TIMEOUT, which caps the exit delay
+        self.release_worker()
+        self._executor.shutdown(wait=False, cancel_futures=True)
         
         event.accept()
 
@@ -649,6 +805,9 @@ def main():
     window = GCPVMManagerGUI()
     window.show()
     
+    # Load config (and the compute client) once the window has painted
+    QTimer.singleShot(0, window.load_initial_config)
+    
     # Start event loop
     sys.exit(app.exec())
 
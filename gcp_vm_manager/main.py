@@ -9,18 +9,113 @@ Provides an interactive menu to start, stop, or leave VMs unchanged based on the
 import os
 import sys
 import json
+import argparse
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, List, Tuple
 
-from google.cloud import compute_v1
-from google.oauth2 import service_account
-from google.auth.exceptions import DefaultCredentialsError
-import google.auth.exceptions
+# google.cloud.compute_v1 is large; it is imported where first needed so that
+# startup and config-only code paths don't pay for it
+if TYPE_CHECKING:
+    from google.cloud import compute_v1
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+CLOUD_PLATFORM_SCOPE = 'https://www.googleapis.com/auth/cloud-platform'
+
+# Environment variables that override configuration keys
+_ENV_MAP = {
+    'GCP_PROJECT_ID': 'project_id',
+    'GCP_ZONE': 'zone',
+    'GCP_INSTANCE_NAME': 'instance_name',
+    'GCP_SERVICE_KEY_PATH': 'service_key_path',
+}
+
+
+# Authenticated compute clients shared across GCPVMManager instances, keyed by
+# service account key path, so reconfiguring does not rebuild credentials and
+# the HTTP session. Each entry records the key file's (mtime, size) so a
+# replaced key file is picked up.
+_client_cache: Dict[str, Tuple[Optional[Tuple[float, int]], "compute_v1.InstancesClient"]] = {}
+
+
+def release_client(service_key_path: str) -> None:
+    """
+    Close and forget the cached compute client for a service account key.
+    
+    Args:
+        service_key_path: Path to the service account JSON key file
+    """
+    entry = _client_cache.pop(service_key_path, None)
+    if entry is not None:
+        entry[1].transport.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _api_errors() -> Tuple[type, ...]:
+    """
+    Get the exception types a Compute Engine API call is expected to raise.
+    
+    Used directly as an except clause, so the Google exception modules are only
+    imported once an error actually occurs.
+    
+    Returns:
+        tuple: API, authentication and I/O (network, timeout) exception types
+    """
+    from google.api_core.exceptions import GoogleAPIError
+    from google.auth.exceptions import GoogleAuthError
+    return (GoogleAPIError, GoogleAuthError, OSError)
+
+
+def _handle(error: BaseException, message: str) -> None:
+    """
+    Report an expected error to the user.
+    
+    Args:
+        error: The exception that was raised
+        message: What was being attempted, with its status emoji
+    """
+    print(f"{message}: {error}")
+
+
+def _status_ttl_from_env(default: float) -> float:
+    """
+    Read the status cache TTL from the GCP_VM_STATUS_TTL environment variable.
+    
+    Args:
+        default: TTL in seconds to use when the variable is unset or invalid
+        
+    Returns:
+        float: TTL in seconds
+    """
+    value = os.environ.get('GCP_VM_STATUS_TTL')
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"⚠️ Ignoring invalid GCP_VM_STATUS_TTL: {value}")
+        return default
 
 
 class GCPVMManager:
     """Manages GCP VM instances with service account authentication."""
     
+    # Upper bound (seconds) on any single compute API call
+    REQUEST_TIMEOUT = 30.0
+    
+    # Upper bound (seconds) when waiting for a start/stop operation to finish
+    OPERATION_TIMEOUT = 120.0
+    
+    # Seconds a fetched status is reused (override with GCP_VM_STATUS_TTL)
+    DEFAULT_STATUS_TTL = 2.0
+    
     def __init__(self, project_id: str, zone: str, instance_name: str, service_key_path: str):
         """
         Initialize the GCP VM Manager.
@@ -36,103 +131,317 @@ class GCPVMManager:
         self.instance_name = instance_name
         self.service_key_path = service_key_path
         self.compute_client = None
+        # Fields identifying this instance in every compute request
+        self._instance_ref = {
+            'project': project_id,
+            'zone': zone,
+            'instance': instance_name,
+        }
+        # Request messages for this instance, built on first use and reused
+        self._requests: Dict[type, Any] = {}
+        self.status_ttl = _status_ttl_from_env(self.DEFAULT_STATUS_TTL)
+        self._status_cache = (None, 0.0)  # (status, monotonic deadline)
+        
+    def _request(self, request_type: type) -> Any:
+        """
+        Get a request message of the given type for this instance.
         
+        Args:
+            request_type: Request message class (e.g., compute_v1.GetInstanceRequest)
+            
+        Returns:
+            The request, built once from the instance fields and then reused
+        """
+        request = self._requests.get(request_type)
+        if request is None:
+            request = self._requests[request_type] = request_type(**self._instance_ref)
+        return request
+    
     def authenticate(self) -> bool:
         """
         Authenticate using the service account key file.
         
+        If the key file does not exist, Application Default Credentials are used
+        instead (e.g. the metadata server when running on GCE).
+        
         Returns:
             bool: True if authentication successful, False otherwise
         """
+        import google.auth
+        from google.auth.exceptions import DefaultCredentialsError
+        from google.cloud import compute_v1
+        from google.oauth2 import service_account
+        
         try:
-            # Check if service key file exists
-            if not Path(self.service_key_path).exists():
-                print(f"❌ Error: Service account key file not found: {self.service_key_path}")
-                return False
+            # Key file (mtime, size), or None when falling back to ADC
+            try:
+                key_stat = os.stat(self.service_key_path)
+                key_stamp = (key_stat.st_mtime, key_stat.st_size)
+            except FileNotFoundError:
+                key_stamp = None
+            source = "service account" if key_stamp is not None else "Application Default Credentials"
             
-            # Load credentials from service account key file
-            credentials = service_account.Credentials.from_service_account_file(
-                self.service_key_path,
-                scopes=['https://www.googleapis.com/auth/cloud-platform']
-            )
+            cached = _client_cache.get(self.service_key_path)
+            if cached is not None and cached[0] == key_stamp:
+                self.compute_client = cached[1]
+                print(f"✅ Successfully authenticated with {source}")
+                return True
+            
+            release_client(self.service_key_path)
+            if key_stamp is not None:
+                # Load credentials from service account key file
+                credentials = service_account.Credentials.from_service_account_file(
+                    self.service_key_path,
+                    scopes=[CLOUD_PLATFORM_SCOPE]
+                )
+            else:
+                try:
+                    credentials, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+                except DefaultCredentialsError:
+                    print(f"❌ Error: Service account key file not found: {self.service_key_path}")
+                    return False
+                print("ℹ️ Service account key file not found, using Application Default Credentials")
             
             # Initialize the compute client with credentials
             self.compute_client = compute_v1.InstancesClient(credentials=credentials)
+            _client_cache[self.service_key_path] = (key_stamp, self.compute_client)
             
-            print("✅ Successfully authenticated with service account")
+            print(f"✅ Successfully authenticated with {source}")
             return True
             
-        except Exception as e:
-            print(f"❌ Authentication failed: {e}")
+        except (ValueError, *_api_errors()) as e:
+            # ValueError covers malformed service account key files
+            _handle(e, "❌ Authentication failed")
             return False
     
-    def get_instance_status(self) -> Optional[str]:
+    def get_instance_status(self, force: bool = False) -> Optional[str]:
         """
         Get the current status of the VM instance.
         
+        A status fetched within the last status_ttl seconds is reused.
+        
+        Args:
+            force: Always query the API, ignoring any cached status
+        
         Returns:
             str: The instance status (RUNNING, TERMINATED, etc.) or None if error
         """
+        status, deadline = self._status_cache
+        if not force and status is not None and time.monotonic() < deadline:
+            return status
+        
+        from google.cloud import compute_v1
+        
         try:
-            request = compute_v1.GetInstanceRequest(
-                project=self.project_id,
-                zone=self.zone,
-                instance=self.instance_name
-            )
-            instance = self.compute_client.get(request=request)
+            request = self._request(compute_v1.GetInstanceRequest)
+            instance = self.compute_client.get(request=request, timeout=self.REQUEST_TIMEOUT)
+            self._status_cache = (instance.status, time.monotonic() + self.status_ttl)
             return instance.status
             
-        except Exception as e:
-            print(f"❌ Error getting instance status: {e}")
+        except _api_errors() as e:
+            _handle(e, "❌ Error getting instance status")
             return None
     
-    def start_instance(self) -> bool:
+    def get_many_statuses(self, instance_names: List[str]) -> Dict[str, Optional[str]]:
         """
-        Start the VM instance.
+        Get the status of several VM instances in this zone with a single list request.
         
+        Args:
+            instance_names: Names of the VM instances
+            
         Returns:
-            bool: True if operation started successfully, False otherwise
+            dict: Instance name to status (None if the instance was not found or on error)
         """
+        statuses: Dict[str, Optional[str]] = dict.fromkeys(instance_names)
+        if not instance_names:
+            return statuses
+        
+        from google.cloud import compute_v1
+        
         try:
-            print(f"🚀 Starting instance '{self.instance_name}'...")
-            request = compute_v1.StartInstanceRequest(
+            request = compute_v1.ListInstancesRequest(
                 project=self.project_id,
                 zone=self.zone,
-                instance=self.instance_name
+                filter=" OR ".join(f'(name = "{name}")' for name in instance_names)
             )
-            operation = self.compute_client.start(request=request)
-            print(f"✅ Start operation initiated successfully: {operation.name}")
-            print("⏳ The instance is starting up (this may take a few moments)")
+            for instance in self.compute_client.list(request=request, timeout=self.REQUEST_TIMEOUT):
+                if instance.name in statuses:
+                    statuses[instance.name] = instance.status
+            
+        except _api_errors() as e:
+            _handle(e, "❌ Error listing instance statuses")
+        
+        return statuses
+    
+    def poll_vm_statuses(self, instance_names: List[str], max_workers: int = 10) -> Dict[str, str]:
+        """
+        Get the status of several VM instances in this zone with concurrent requests.
+        
+        Args:
+            instance_names: Names of the VM instances
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            dict: Instance name to status ('unknown' if the request failed)
+        """
+        from google.cloud import compute_v1
+        
+        def get_status(name: str) -> str:
+            request = compute_v1.GetInstanceRequest({**self._instance_ref, 'instance': name})
+            return self.compute_client.get(request=request, timeout=self.REQUEST_TIMEOUT).status
+        
+        statuses: Dict[str, str] = {}
+        if not instance_names:
+            return statuses
+        
+        # The client's session is shared by all workers
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(instance_names))) as executor:
+            futures = {executor.submit(get_status, name): name for name in instance_names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    statuses[name] = future.result()
+                except _api_errors() as e:
+                    _handle(e, f"⚠️ Error getting status of '{name}'")
+                    statuses[name] = "unknown"
+        
+        return statuses
+    
+    def list_all(self, filter_expr: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        """
+        List all VM instances in the project across every zone.
+        
+        Uses a single paginated aggregated list request, asking the API for only
+        the name and status fields to keep responses small.
+        
+        Args:
+            filter_expr: Optional Compute Engine filter expression (e.g., 'status = RUNNING')
+            
+        Yields:
+            tuple: (zone, instance name, status) for each instance
+        """
+        from google.cloud import compute_v1
+        
+        request = compute_v1.AggregatedListInstancesRequest(project=self.project_id, max_results=500)
+        if filter_expr:
+            request.filter = filter_expr
+        
+        pages = self.compute_client.aggregated_list(
+            request=request,
+            timeout=self.REQUEST_TIMEOUT,
+            metadata=[("x-goog-fieldmask", "nextPageToken,items/*/instances(name,status)")]
+        )
+        for scope, scoped_list in pages:
+            zone = scope.rpartition('/')[2]
+            for instance in scoped_list.instances:
+                yield zone, instance.name, instance.status
+    
+    def start_instance(self, wait: bool = True) -> bool:
+        """
+        Start the VM instance.
+        
+        Args:
+            wait: Block until the start operation finishes (up to OPERATION_TIMEOUT)
+        
+        Returns:
+            bool: True if the operation completed (or, with wait=False, started)
+            successfully, False otherwise
+        """
+        from google.cloud import compute_v1
+        
+        self._status_cache = (None, 0.0)
+        try:
+            print(f"🚀 Starting instance '{self.instance_name}'...")
+            request = self._request(compute_v1.StartInstanceRequest)
+            operation = self.compute_client.start(request=request, timeout=self.REQUEST_TIMEOUT)
+            if not wait:
+                print(f"✅ Start operation initiated successfully: {operation.name}")
+                return True
+            
+            operation.result(timeout=self.OPERATION_TIMEOUT)
+            print(f"✅ Instance '{self.instance_name}' started")
             return True
             
-        except Exception as e:
-            print(f"❌ Error starting instance: {e}")
+        except _api_errors() as e:
+            _handle(e, "❌ Error starting instance")
             return False
     
-    def stop_instance(self) -> bool:
+    def stop_instance(self, wait: bool = True) -> bool:
         """
         Stop the VM instance.
         
+        Args:
+            wait: Block until the stop operation finishes (up to OPERATION_TIMEOUT)
+        
         Returns:
-            bool: True if operation started successfully, False otherwise
+            bool: True if the operation completed (or, with wait=False, started)
+            successfully, False otherwise
         """
+        from google.cloud import compute_v1
+        
+        self._status_cache = (None, 0.0)
         try:
             print(f"🛑 Stopping instance '{self.instance_name}'...")
-            request = compute_v1.StopInstanceRequest(
-                project=self.project_id,
-                zone=self.zone,
-                instance=self.instance_name
-            )
-            operation = self.compute_client.stop(request=request)
-            print(f"✅ Stop operation initiated successfully: {operation.name}")
-            print("⏳ The instance is shutting down (this may take a few moments)")
+            request = self._request(compute_v1.StopInstanceRequest)
+            operation = self.compute_client.stop(request=request, timeout=self.REQUEST_TIMEOUT)
+            if not wait:
+                print(f"✅ Stop operation initiated successfully: {operation.name}")
+                return True
+            
+            operation.result(timeout=self.OPERATION_TIMEOUT)
+            print(f"✅ Instance '{self.instance_name}' stopped")
             return True
             
-        except Exception as e:
-            print(f"❌ Error stopping instance: {e}")
+        except _api_errors() as e:
+            _handle(e, "❌ Error stopping instance")
             return False
+    
+    def wait_for_status(self, target: str, upper_bound_s: float = 60.0, q_w: float = 300.0) -> bool:
+        """
+        Wait for the VM instance to reach a status.
+        
+        Polls every 2 seconds up to the expected transition time, then backs off
+        exponentially (capped at q_w / 4) so late transitions are still seen
+        without hammering the API.
+        
+        Args:
+            target: Status to wait for (e.g., 'RUNNING')
+            upper_bound_s: Expected upper bound on the transition time, in seconds
+            q_w: Additional time to keep waiting after upper_bound_s, in seconds
+            
+        Returns:
+            bool: True if the instance reached the status, False on timeout
+        """
+        start = time.monotonic()
+        deadline = start + upper_bound_s + q_w
+        interval = 2.0
+        
+        while True:
+            if self.get_instance_status(force=True) == target:
+                return True
+            
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            if now - start >= upper_bound_s:
+                interval = min(interval * 2, q_w / 4)
+            time.sleep(min(interval, deadline - now))
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
+
+@functools.lru_cache(maxsize=1)
 def get_config_file_path() -> Path:
     """
     Get the path to the configuration file.
@@ -141,9 +450,11 @@ def get_config_file_path() -> Path:
         Path: Path to the configuration file
     """
     # Use user's home directory for config file
-    config_dir = Path.home() / '.gcp-vm-manager'
-    config_dir.mkdir(exist_ok=True)
-    return config_dir / 'config.json'
+    return Path.home() / '.gcp-vm-manager' / 'config.json'
+
+
+# Set once the config directory has been created by this process
+_config_dir_ready = False
 
 
 def save_config(config: Dict[str, Any]) -> bool:
@@ -156,14 +467,30 @@ def save_config(config: Dict[str, Any]) -> bool:
     Returns:
         bool: True if saved successfully, False otherwise
     """
+    global _config_dir_ready
     try:
         config_file = get_config_file_path()
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        if not _config_dir_ready:
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            _config_dir_ready = True
+        # Write to a temporary file and rename it into place, so a crash
+        # mid-write never leaves a truncated config behind
+        tmp_file = config_file.with_suffix('.json.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
         print(f"✅ Configuration saved to: {config_file}")
         return True
-    except Exception as e:
-        print(f"❌ Error saving configuration: {e}")
+    except (OSError, TypeError) as e:
+        # TypeError: a value that cannot be serialized to JSON
+        _handle(e, "❌ Error saving configuration")
         return False
 
 
@@ -176,12 +503,14 @@ def clear_saved_config() -> bool:
     """
     try:
         config_file = get_config_file_path()
-        if config_file.exists():
+        try:
             config_file.unlink()
-            print(f"✅ Configuration cleared: {config_file}")
+        except FileNotFoundError:
+            return True
+        print(f"✅ Configuration cleared: {config_file}")
         return True
-    except Exception as e:
-        print(f"❌ Error clearing configuration: {e}")
+    except OSError as e:
+        _handle(e, "❌ Error clearing configuration")
         return False
 
 
@@ -193,22 +522,39 @@ def load_saved_config() -> Dict[str, Any]:
         dict: Configuration dictionary (empty if no saved config)
     """
     try:
-        config_file = get_config_file_path()
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)
-    except Exception as e:
-        print(f"⚠️ Error loading saved configuration: {e}")
+        with open(get_config_file_path(), 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        _handle(e, "⚠️ Error loading saved configuration")
     
     return {}
 
 
-def load_config() -> dict:
+def apply_env_overrides(config: Dict[str, Any]) -> None:
+    """
+    Override configuration values with GCP_* environment variables that are set.
+    
+    Args:
+        config: Configuration dictionary to update in place
+    """
+    for env_key, config_key in _ENV_MAP.items():
+        value = os.environ.get(env_key)
+        if value:
+            config[config_key] = value
+
+
+def load_config(overrides: Optional[Dict[str, str]] = None) -> dict:
     """
     Load configuration from various sources in priority order:
     1. Saved configuration file
     2. Environment variables
-    3. User prompts (for console application)
+    3. Command-line overrides
+    4. User prompts (for console application, only when stdin is a terminal)
+    
+    Args:
+        overrides: Configuration values given on the command line (None values are ignored)
     
     Returns:
         dict: Configuration dictionary
@@ -221,14 +567,15 @@ def load_config() -> dict:
         config.update(saved_config)
     
     # Override with environment variables if set
-    if os.getenv('GCP_PROJECT_ID'):
-        config['project_id'] = os.getenv('GCP_PROJECT_ID')
-    if os.getenv('GCP_ZONE'):
-        config['zone'] = os.getenv('GCP_ZONE')
-    if os.getenv('GCP_INSTANCE_NAME'):
-        config['instance_name'] = os.getenv('GCP_INSTANCE_NAME')
-    if os.getenv('GCP_SERVICE_KEY_PATH'):
-        config['service_key_path'] = os.getenv('GCP_SERVICE_KEY_PATH')
+    apply_env_overrides(config)
+    
+    # Override with command-line arguments
+    if overrides:
+        config.update({key: value for key, value in overrides.items() if value})
+    
+    # Without a terminal there is nobody to prompt; validation reports what's missing
+    if not sys.stdin.isatty():
+        return config
     
     # For console application, prompt for missing values
     # GUI application will handle missing values differently
@@ -257,16 +604,24 @@ def validate_config(config: dict) -> bool:
     Returns:
         bool: True if configuration is valid, False otherwise
     """
-    required_fields = ['project_id', 'zone', 'instance_name', 'service_key_path']
+    required_fields = ('project_id', 'zone', 'instance_name', 'service_key_path')
     
-    for field in required_fields:
-        if not config.get(field):
-            print(f"❌ Error: {field} is required")
-            return False
+    missing = [field for field in required_fields if not config.get(field)]
+    if missing:
+        print(f"❌ Missing required fields: {', '.join(missing)}")
+        return False
     
     return True
 
 
+# Menu text, built once; display_menu only fills in the status
+_MENU_BANNER = "\n" + "=" * 50 + "\n🔧 GCP VM Manager - Action Menu\n" + "=" * 50
+_MENU_RUNNING = "📋 Available Actions:\n1. 🛑 Stop the VM\n2. ⏸️  Do nothing"
+_MENU_TERMINATED = "📋 Available Actions:\n1. 🚀 Start the VM\n2. ⏸️  Do nothing"
+_MENU_OTHER = "📋 Available Actions:\n1. 🚀 Try to start the VM\n2. 🛑 Try to stop the VM\n3. ⏸️  Do nothing"
+_MENU_ACTIONS = {"RUNNING": _MENU_RUNNING, "TERMINATED": _MENU_TERMINATED}
+
+
 def display_menu(vm_status: str) -> None:
     """
     Display the interactive menu based on VM status.
@@ -274,25 +629,8 @@ def display_menu(vm_status: str) -> None:
     Args:
         vm_status: Current VM status
     """
-    print("\n" + "="*50)
-    print("🔧 GCP VM Manager - Action Menu")
-    print("="*50)
-    print(f"VM Status: {vm_status}")
-    print()
-    
-    if vm_status == "RUNNING":
-        print("📋 Available Actions:")
-        print("1. 🛑 Stop the VM")
-        print("2. ⏸️  Do nothing")
-    elif vm_status == "TERMINATED":
-        print("📋 Available Actions:")
-        print("1. 🚀 Start the VM")
-        print("2. ⏸️  Do nothing")
-    else:
-        print("📋 Available Actions:")
-        print("1. 🚀 Try to start the VM")
-        print("2. 🛑 Try to stop the VM")
-        print("3. ⏸️  Do nothing")
+    actions = _MENU_ACTIONS.get(vm_status, _MENU_OTHER)
+    print(f"{_MENU_BANNER}\nVM Status: {vm_status}\n\n{actions}")
 
 
 def get_user_choice(vm_status: str) -> str:
@@ -332,11 +670,25 @@ def get_user_choice(vm_status: str) -> str:
 
 def main():
     """Main application entry point."""
+    parser = argparse.ArgumentParser(description="Start, stop, or check a GCP VM instance.")
+    parser.add_argument('--project', help="GCP Project ID")
+    parser.add_argument('--zone', help="GCP Zone (e.g., us-central1-a)")
+    parser.add_argument('--instance', help="VM Instance Name")
+    parser.add_argument('--key', help="Path to service account key file")
+    parser.add_argument('--action', choices=['start', 'stop', 'status', 'nothing'],
+                        help="Action to take without showing the interactive menu")
+    args = parser.parse_args()
+    
     print("🔧 GCP VM Manager")
     print("="*30)
     
     # Load configuration
-    config = load_config()
+    config = load_config({
+        'project_id': args.project,
+        'zone': args.zone,
+        'instance_name': args.instance,
+        'service_key_path': args.key,
+    })
     
     # Validate configuration
     if not validate_config(config):
@@ -364,9 +716,16 @@ def main():
         print("❌ Failed to get VM status. Exiting.")
         sys.exit(1)
     
-    # Display menu and get user choice
-    display_menu(vm_status)
-    choice = get_user_choice(vm_status)
+    # Use the requested action, or display menu and get user choice
+    if args.action:
+        print(f"📊 VM Status: {vm_status}")
+        choice = args.action
+    elif sys.stdin.isatty():
+        display_menu(vm_status)
+        choice = get_user_choice(vm_status)
+    else:
+        print("❌ stdin is not a terminal; use --action to choose what to do. Exiting.")
+        sys.exit(1)
     
     # Execute user choice
     print("\n" + "="*50)
@@ -376,12 +735,14 @@ def main():
             print("🎉 VM start operation completed successfully!")
         else:
             print("❌ Failed to start VM.")
+            sys.exit(1)
     elif choice == "stop":
         success = vm_manager.stop_instance()
         if success:
             print("🎉 VM stop operation completed successfully!")
         else:
             print("❌ Failed to stop VM.")
+            sys.exit(1)
     else:
         print("⏸️  No action taken. VM state unchanged.")
     